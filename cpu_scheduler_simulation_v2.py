@@ -1,205 +1,259 @@
+import bisect
+import heapq
+import io
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import groupby
 import streamlit as st
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from typing import List, Tuple
+from matplotlib.figure import Figure
+from typing import List, Optional, Tuple
+from scheduler_kernels import round_robin_kernel, preemptive_kernel, make_sequential_runner
 
 # Define Process type: (pid, arrival, burst, priority)
 Process = Tuple[str, int, int, int]
 
+# Schedule: parallel (process index, start, end) arrays, one entry per execution slice.
+# PIDs are attached in run_simulation.
+Schedule = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+# Scheduler result: (schedule, first start per process, completion time per process).
+# Process indices and the per-process arrays follow the input order of the processes.
+ScheduleResult = Tuple[Schedule, np.ndarray, np.ndarray]
+
+@dataclass(frozen=True, eq=False)
+class Processes:
+    """Process table stored as parallel arrays (one entry per process, in input order)."""
+    pids: np.ndarray
+    arrivals: np.ndarray
+    bursts: np.ndarray
+    priorities: np.ndarray
+    # Summary values that don't depend on ordering, computed once
+    min_arrival: int
+    total_burst: int
+
+    @classmethod
+    def from_list(cls, processes: List[Process]) -> "Processes":
+        """Build the arrays from (pid, arrival, burst, priority) tuples."""
+        arrivals = np.array([p[1] for p in processes], dtype=np.int64)
+        bursts = np.array([p[2] for p in processes], dtype=np.int64)
+        return cls(
+            pids=np.array([p[0] for p in processes], dtype=str),
+            arrivals=arrivals,
+            bursts=bursts,
+            priorities=np.array([p[3] for p in processes], dtype=np.int64),
+            min_arrival=int(arrivals.min()),
+            total_burst=int(bursts.sum()),
+        )
+
+    def take(self, order: np.ndarray) -> "Processes":
+        """Return the same processes reordered by an index array."""
+        return Processes(self.pids[order], self.arrivals[order], self.bursts[order], self.priorities[order],
+                         self.min_arrival, self.total_burst)
+
+    def arrival_order(self) -> np.ndarray:
+        """Indices that sort the processes by arrival, keeping input order for ties."""
+        return np.argsort(self.arrivals, kind="stable")
+
+def split_events(events: np.ndarray, order: Optional[np.ndarray] = None) -> Schedule:
+    """Split kernel (process index, start, end) rows into schedule arrays.
+
+    Pass the permutation the kernel ran under as order to map its indices back
+    to input positions.
+    """
+    pid_idx = events[:, 0] if order is None else order[events[:, 0]]
+    return pid_idx, events[:, 1], events[:, 2]
+
+def to_input_order(order: np.ndarray, values) -> np.ndarray:
+    """Undo a reordering: values[k] belongs to the process at input position order[k]."""
+    result = np.empty(len(order), dtype=np.int64)
+    result[order] = values
+    return result
+
+# Largest process count the sidebar allows
+MAX_PROCESSES = 10
+# run_in_order uses generated straight-line code for every size the UI can produce
+MAX_UNROLLED_PROCESSES = MAX_PROCESSES
+
+def run_in_order(processes: Processes, order: np.ndarray) -> ScheduleResult:
+    """Run processes to completion one after another in the given order."""
+    arrivals = processes.arrivals[order].tolist()
+    bursts = processes.bursts[order].tolist()
+    if len(order) <= MAX_UNROLLED_PROCESSES:
+        starts, ends = make_sequential_runner(len(order))(arrivals, bursts)
+    else:
+        current_time = 0
+        starts, ends = [], []
+        for arrival, burst in zip(arrivals, bursts):
+            start_time = max(current_time, arrival)
+            end_time = start_time + burst
+            starts.append(start_time)
+            ends.append(end_time)
+            current_time = end_time
+    starts = np.array(starts, dtype=np.int64)
+    ends = np.array(ends, dtype=np.int64)
+    return (order, starts, ends), to_input_order(order, starts), to_input_order(order, ends)
+
+def run_preemptive(processes: Processes, by_remaining: bool) -> ScheduleResult:
+    """Run preemptive_kernel on the arrival-sorted processes and map results back."""
+    order = processes.arrival_order()
+    p = processes.take(order)
+    events, first_starts, completion_times = preemptive_kernel(p.arrivals, p.bursts, p.priorities, by_remaining)
+    return split_events(events, order), to_input_order(order, first_starts), to_input_order(order, completion_times)
+
 # Scheduling Functions
-def fcfs_scheduling(processes: List[Process]) -> List[Tuple[str, int, int]]:
+def fcfs_scheduling(processes: Processes) -> ScheduleResult:
     """First-Come-First-Serve Scheduling: Non-preemptive."""
-    processes = sorted(processes, key=lambda x: x[1])
-    current_time = 0
-    schedule = []
-    for pid, arrival, burst, _ in processes:
-        start_time = max(current_time, arrival)
-        end_time = start_time + burst
-        schedule.append((pid, start_time, end_time))
-        current_time = end_time
-    return schedule
+    return run_in_order(processes, processes.arrival_order())
 
-def sjn_scheduling(processes: List[Process]) -> List[Tuple[str, int, int]]:
+def sjn_scheduling(processes: Processes) -> ScheduleResult:
     """Shortest Job Next Scheduling: Non-preemptive."""
-    processes = processes.copy()
+    arrivals = processes.arrivals.tolist()
+    bursts = processes.bursts.tolist()
+    order = processes.arrival_order()
+    sorted_arrivals = processes.arrivals[order].tolist()
+    order = order.tolist()
+    next_idx = 0
     current_time = 0
-    schedule = []
-    ready_queue = []
-    while processes or ready_queue:
-        while processes and processes[0][1] <= current_time:
-            ready_queue.append(processes.pop(0))
+    pid_idx, starts, ends = [], [], []
+    first_starts = [0] * len(order)
+    completion_times = [0] * len(order)
+    ready_queue = []  # min-heap of (burst, arrival, index)
+    while next_idx < len(order) or ready_queue:
+        # Everything up to the bisect cut has arrived by now
+        arrived = bisect.bisect_right(sorted_arrivals, current_time, next_idx)
+        for i in order[next_idx:arrived]:
+            heapq.heappush(ready_queue, (bursts[i], arrivals[i], i))
+        next_idx = arrived
         if ready_queue:
-            ready_queue.sort(key=lambda x: x[2])
-            pid, arrival, burst, _ = ready_queue.pop(0)
+            _, _, i = heapq.heappop(ready_queue)
             start_time = current_time
-            end_time = start_time + burst
-            schedule.append((pid, start_time, end_time))
+            end_time = start_time + bursts[i]
+            pid_idx.append(i)
+            starts.append(start_time)
+            ends.append(end_time)
+            first_starts[i] = start_time
+            completion_times[i] = end_time
             current_time = end_time
         else:
-            current_time = processes[0][1] if processes else current_time + 1
-    return schedule
-
-def sjn_preemptive_scheduling(processes: List[Process]) -> List[Tuple[str, int, int]]:
-    """Shortest Job Next with Preemption (SRTF): Preemptive."""
-    processes = [(pid, arrival, burst, burst, priority) for pid, arrival, burst, priority in processes]
-    current_time = min(p[1] for p in processes)
-    schedule = []
-    ready_queue = []
-    active_process = None
-    while processes or ready_queue or active_process:
-        while processes and processes[0][1] <= current_time:
-            ready_queue.append(processes.pop(0))
-        if not active_process and ready_queue:
-            ready_queue.sort(key=lambda x: x[2])
-            active_process = ready_queue.pop(0)
-        if active_process:
-            pid, arrival, remaining, original_burst, priority = active_process
-            start_time = current_time
-            next_arrival = min((p[1] for p in processes if p[1] > current_time), default=float('inf'))
-            time_slice = min(1, remaining, max(1, next_arrival - current_time))
-            current_time += time_slice
-            remaining -= time_slice
-            schedule.append((pid, start_time, current_time))
-            new_arrivals = [p for p in processes if p[1] <= current_time]
-            if new_arrivals:
-                ready_queue.extend(new_arrivals)
-                processes = [p for p in processes if p[1] > current_time]
-                ready_queue.sort(key=lambda x: x[2])
-                if ready_queue and ready_queue[0][2] < remaining:
-                    ready_queue.append((pid, arrival, remaining, original_burst, priority))
-                    active_process = ready_queue.pop(0)
-                elif remaining == 0:
-                    active_process = None
-                else:
-                    active_process = (pid, arrival, remaining, original_burst, priority)
-            elif remaining == 0:
-                active_process = None
-            else:
-                active_process = (pid, arrival, remaining, original_burst, priority)
-        else:
-            current_time += 1
-    return schedule
+            # CPU is idle: jump straight to the next arrival
+            current_time = sorted_arrivals[next_idx]
+    schedule = (np.array(pid_idx, dtype=np.int64), np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64))
+    return schedule, np.array(first_starts, dtype=np.int64), np.array(completion_times, dtype=np.int64)
 
-def round_robin_scheduling(processes: List[Process], quantum: int) -> List[Tuple[str, int, int]]:
+def round_robin_scheduling(processes: Processes, quantum: int) -> ScheduleResult:
     """Round Robin Scheduling: Preemptive."""
-    queue = [(pid, arrival, burst, priority) for pid, arrival, burst, priority in processes]
-    current_time = 0
-    schedule = []
-    while queue:
-        pid, arrival, burst, priority = queue.pop(0)
-        start_time = max(current_time, arrival)
-        time_slice = min(quantum, burst)
-        end_time = start_time + time_slice
-        schedule.append((pid, start_time, end_time))
-        current_time = end_time
-        remaining_burst = burst - time_slice
-        if remaining_burst > 0:
-            queue.append((pid, arrival, remaining_burst, priority))
-    return schedule
+    events, first_starts, completion_times = round_robin_kernel(processes.arrivals, processes.bursts, quantum)
+    return split_events(events), first_starts, completion_times
 
-def priority_scheduling(processes: List[Process]) -> List[Tuple[str, int, int]]:
+def priority_scheduling(processes: Processes) -> ScheduleResult:
     """Priority Scheduling: Non-preemptive."""
-    processes = sorted(processes, key=lambda x: (x[3], x[1]))
-    current_time = 0
-    schedule = []
-    for pid, arrival, burst, priority in processes:
-        start_time = max(current_time, arrival)
-        end_time = start_time + burst
-        schedule.append((pid, start_time, end_time))
-        current_time = end_time
-    return schedule
+    return run_in_order(processes, np.lexsort((processes.arrivals, processes.priorities)))
 
-def priority_preemptive_scheduling(processes: List[Process]) -> List[Tuple[str, int, int]]:
+def sjn_preemptive_scheduling(processes: Processes) -> ScheduleResult:
+    """Shortest Job Next with Preemption (SRTF): Preemptive."""
+    return run_preemptive(processes, True)
+
+def priority_preemptive_scheduling(processes: Processes) -> ScheduleResult:
     """Priority Scheduling with Preemption: Preemptive."""
-    processes = [(pid, arrival, burst, burst, priority) for pid, arrival, burst, priority in processes]
-    current_time = min(p[1] for p in processes)
-    schedule = []
-    ready_queue = []
-    active_process = None
-    while processes or ready_queue or active_process:
-        while processes and processes[0][1] <= current_time:
-            ready_queue.append(processes.pop(0))
-        if not active_process and ready_queue:
-            ready_queue.sort(key=lambda x: x[4])
-            active_process = ready_queue.pop(0)
-        if active_process:
-            pid, arrival, remaining, original_burst, priority = active_process
-            start_time = current_time
-            next_arrival = min((p[1] for p in processes if p[1] > current_time), default=float('inf'))
-            time_slice = min(1, remaining, max(1, next_arrival - current_time))
-            current_time += time_slice
-            remaining -= time_slice
-            schedule.append((pid, start_time, current_time))
-            new_arrivals = [p for p in processes if p[1] <= current_time]
-            if new_arrivals:
-                ready_queue.extend(new_arrivals)
-                processes = [p for p in processes if p[1] > current_time]
-                ready_queue.sort(key=lambda x: x[4])
-                if ready_queue and ready_queue[0][4] < priority:
-                    ready_queue.append((pid, arrival, remaining, original_burst, priority))
-                    active_process = ready_queue.pop(0)
-                elif remaining == 0:
-                    active_process = None
-                else:
-                    active_process = (pid, arrival, remaining, original_burst, priority)
-            elif remaining == 0:
-                active_process = None
-            else:
-                active_process = (pid, arrival, remaining, original_burst, priority)
-        else:
-            current_time += 1
-    return schedule
+    return run_preemptive(processes, False)
 
 # Waiting Time Calculation Functions
-def calculate_waiting_time(schedule: List[Tuple[str, int, int]], processes: List[Process]) -> Tuple[dict, float, dict, float, dict, float]:
+def summarize_metrics(pids: np.ndarray, waiting: np.ndarray, turnaround: np.ndarray, response: np.ndarray) -> Tuple[dict, float, dict, float, dict, float]:
+    """Turn per-process metric arrays into the (per-process dict, average) pairs shown in the UI."""
+    pids = pids.tolist()
+    avg_waiting = float(waiting.mean()) if waiting.size else 0
+    avg_turnaround = float(turnaround.mean()) if turnaround.size else 0
+    avg_response = float(response.mean()) if response.size else 0
+    return (dict(zip(pids, waiting.tolist())), avg_waiting,
+            dict(zip(pids, turnaround.tolist())), avg_turnaround,
+            dict(zip(pids, response.tolist())), avg_response)
+
+def calculate_waiting_time(first_starts: np.ndarray, completion_times: np.ndarray, processes: Processes) -> Tuple[dict, float, dict, float, dict, float]:
     """Calculate metrics for non-preemptive algorithms."""
-    process_dict = {p[0]: p[1] for p in processes}
-    first_starts = {}
-    completion_times = {}
-    for pid, start, end in schedule:
-        if pid not in first_starts:
-            first_starts[pid] = start
-        completion_times[pid] = end
-    waiting_times = {pid: max(0, first_starts[pid] - process_dict[pid]) for pid in process_dict if pid in first_starts}
-    turnaround_times = {pid: completion_times[pid] - process_dict[pid] for pid in process_dict}
-    response_times = {pid: first_starts[pid] - process_dict[pid] for pid in process_dict}
-    avg_waiting = sum(waiting_times.values()) / len(waiting_times) if waiting_times else 0
-    avg_turnaround = sum(turnaround_times.values()) / len(turnaround_times) if turnaround_times else 0
-    avg_response = sum(response_times.values()) / len(response_times) if response_times else 0
-    return waiting_times, avg_waiting, turnaround_times, avg_turnaround, response_times, avg_response
+    waiting_times = np.maximum(0, first_starts - processes.arrivals)
+    turnaround_times = completion_times - processes.arrivals
+    response_times = first_starts - processes.arrivals
+    return summarize_metrics(processes.pids, waiting_times, turnaround_times, response_times)
 
-def calculate_preemptive_waiting_time(schedule: List[Tuple[str, int, int]], processes: List[Process]) -> Tuple[dict, float, dict, float, dict, float]:
+def calculate_preemptive_waiting_time(first_starts: np.ndarray, completion_times: np.ndarray, processes: Processes) -> Tuple[dict, float, dict, float, dict, float]:
     """Calculate metrics for preemptive algorithms."""
-    process_dict = {p[0]: (p[1], p[2]) for p in processes}
-    waiting_times = {}
-    first_starts = {}
-    completion_times = {}
-    last_end = {}
-    for pid, start, end in schedule:
-        if pid not in first_starts:
-            first_starts[pid] = start
-        if pid in process_dict:
-            arrival, _ = process_dict[pid]
-            if pid not in waiting_times:
-                waiting_times[pid] = max(0, start - arrival)
-            elif pid in last_end:
-                waiting_times[pid] += start - last_end[pid]
-            last_end[pid] = end
-        completion_times[pid] = end
-    turnaround_times = {pid: completion_times[pid] - process_dict[pid][0] for pid in process_dict}
-    response_times = {pid: first_starts[pid] - process_dict[pid][0] for pid in process_dict}
-    avg_waiting = sum(waiting_times.values()) / len(waiting_times) if waiting_times else 0
-    avg_turnaround = sum(turnaround_times.values()) / len(turnaround_times) if turnaround_times else 0
-    avg_response = sum(response_times.values()) / len(response_times) if response_times else 0
-    return waiting_times, avg_waiting, turnaround_times, avg_turnaround, response_times, avg_response
+    # Everything between arrival and completion that was not spent running was spent waiting
+    waiting_times = completion_times - processes.arrivals - processes.bursts
+    turnaround_times = completion_times - processes.arrivals
+    response_times = first_starts - processes.arrivals
+    return summarize_metrics(processes.pids, waiting_times, turnaround_times, response_times)
+
+# Simulation Driver
+@lru_cache(maxsize=16)
+def load_processes(processes: Tuple[Process, ...]) -> Processes:
+    """Convert the process tuples to arrays once per rerun; the six runs of Compare All share them."""
+    return Processes.from_list(processes)
+
+def run_simulation(processes: Tuple[Process, ...], algo: str, quantum: int):
+    """Run one algorithm and compute its metrics."""
+    procs = load_processes(processes)
+    if algo == "FCFS":
+        schedule, first_starts, completion_times = fcfs_scheduling(procs)
+        wt, awt, tt, att, rt, art = calculate_waiting_time(first_starts, completion_times, procs)
+    elif algo == "SJN":
+        schedule, first_starts, completion_times = sjn_scheduling(procs)
+        wt, awt, tt, att, rt, art = calculate_waiting_time(first_starts, completion_times, procs)
+    elif algo == "SJN with Preemption":
+        schedule, first_starts, completion_times = sjn_preemptive_scheduling(procs)
+        wt, awt, tt, att, rt, art = calculate_preemptive_waiting_time(first_starts, completion_times, procs)
+    elif algo == "Round Robin":
+        schedule, first_starts, completion_times = round_robin_scheduling(procs, quantum)
+        wt, awt, tt, att, rt, art = calculate_preemptive_waiting_time(first_starts, completion_times, procs)
+    elif algo == "Priority":
+        schedule, first_starts, completion_times = priority_scheduling(procs)
+        wt, awt, tt, att, rt, art = calculate_waiting_time(first_starts, completion_times, procs)
+    elif algo == "Priority with Preemption":
+        schedule, first_starts, completion_times = priority_preemptive_scheduling(procs)
+        wt, awt, tt, att, rt, art = calculate_preemptive_waiting_time(first_starts, completion_times, procs)
+    
+    # Schedulers work on process indices; attach the PIDs for display
+    pid_idx, starts, ends = schedule
+    schedule = (procs.pids[pid_idx], starts, ends)
+    
+    total_time = int(ends[-1]) - procs.min_arrival
+    busy_time = procs.total_burst
+    cpu_util = (busy_time / total_time) * 100 if total_time > 0 else 0
+    throughput = len(processes) / total_time if total_time > 0 else 0
+    
+    return schedule, wt, awt, tt, att, rt, art, cpu_util, throughput
+
+# Gantt Chart
+@st.cache_data(max_entries=32)
+def render_gantt(pids: np.ndarray, starts: np.ndarray, ends: np.ndarray, title: str) -> bytes:
+    """Render the Gantt chart to PNG bytes; the image, not the figure, is cached across reruns."""
+    # A standalone Figure (not pyplot) so concurrent sessions never share drawing state
+    fig = Figure(figsize=(10, 2))
+    ax = fig.subplots()
+    ax.broken_barh(np.column_stack((starts, ends - starts)), (-0.25, 0.5), facecolors=plt.cm.Paired(np.linspace(0, 1, len(starts))), edgecolor='black')
+    # One label per run of consecutive slices, not per slice
+    for pid, run in groupby(zip(pids.tolist(), starts.tolist(), ends.tolist()), key=lambda s: s[0]):
+        run = list(run)
+        start, end = run[0][1], run[-1][2]
+        ax.text(start + (end - start) / 2, 0, pid, ha='center', va='center', color='black', fontweight='bold')
+    ax.set_yticks([])
+    ax.set_xticks(np.append(starts, ends[-1]))
+    ax.set_xlabel("Time")
+    ax.set_title(title)
+    fig.tight_layout()
+    # Same savefig options st.pyplot uses
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight", dpi=200)
+    return buf.getvalue()
 
 # Streamlit UI
 def main():
     st.title("Process Scheduling Simulator v2")
     st.sidebar.header("Process Configuration")
     
-    num_processes = st.sidebar.number_input("Number of Processes", min_value=1, max_value=10, value=3)
+    num_processes = st.sidebar.number_input("Number of Processes", min_value=1, max_value=MAX_PROCESSES, value=3)
     quantum = st.sidebar.number_input("Time Quantum (for Round Robin)", min_value=1, value=2)
     
     # Process input
@@ -224,40 +278,16 @@ def main():
     
     algorithm_options = ["FCFS", "SJN", "SJN with Preemption", "Round Robin", "Priority", "Priority with Preemption"]
     algorithm = st.selectbox("Select Scheduling Algorithm", algorithm_options)
-    
-    def run_simulation(processes, algo, quantum):
-        if algo == "FCFS":
-            schedule = fcfs_scheduling(processes)
-            wt, awt, tt, att, rt, art = calculate_waiting_time(schedule, processes)
-        elif algo == "SJN":
-            schedule = sjn_scheduling(processes)
-            wt, awt, tt, att, rt, art = calculate_waiting_time(schedule, processes)
-        elif algo == "SJN with Preemption":
-            schedule = sjn_preemptive_scheduling(processes)
-            wt, awt, tt, att, rt, art = calculate_preemptive_waiting_time(schedule, processes)
-        elif algo == "Round Robin":
-            schedule = round_robin_scheduling(processes, quantum)
-            wt, awt, tt, att, rt, art = calculate_preemptive_waiting_time(schedule, processes)
-        elif algo == "Priority":
-            schedule = priority_scheduling(processes)
-            wt, awt, tt, att, rt, art = calculate_waiting_time(schedule, processes)
-        elif algo == "Priority with Preemption":
-            schedule = priority_preemptive_scheduling(processes)
-            wt, awt, tt, att, rt, art = calculate_preemptive_waiting_time(schedule, processes)
-        
-        total_time = schedule[-1][2] - min(p[1] for p in processes)
-        busy_time = sum(p[2] for p in processes)
-        cpu_util = (busy_time / total_time) * 100 if total_time > 0 else 0
-        throughput = len(processes) / total_time if total_time > 0 else 0
-        
-        return schedule, wt, awt, tt, att, rt, art, cpu_util, throughput
+    # Hashable input shared by every run_simulation call below (load_processes keys on it)
+    processes = tuple(process_list)
     
     if st.button("Run Simulation"):
         try:
-            schedule, waiting_times, avg_waiting, turnaround_times, avg_turnaround, response_times, avg_response, cpu_utilization, throughput = run_simulation(process_list, algorithm, quantum)
+            schedule, waiting_times, avg_waiting, turnaround_times, avg_turnaround, response_times, avg_response, cpu_utilization, throughput = run_simulation(processes, algorithm, quantum)
             
             # Display Schedule
-            df = pd.DataFrame(schedule, columns=["Process", "Start Time", "End Time"])
+            pids, starts, ends = schedule
+            df = pd.DataFrame({"Process": pids, "Start Time": starts, "End Time": ends})
             st.subheader("Execution Schedule")
             st.table(df)
             
@@ -271,20 +301,20 @@ def main():
             st.write("Per Process Metrics:", {pid: f"Wait={waiting_times[pid]:.2f}, Turn={turnaround_times[pid]:.2f}, Resp={response_times[pid]:.2f}" for pid in waiting_times})
             
             # Gantt Chart
-            fig, ax = plt.subplots(figsize=(10, 2))
-            colors = plt.cm.Paired(np.linspace(0, 1, len(schedule)))
-            for i, (pid, start, end) in enumerate(schedule):
-                ax.barh(0, end - start, left=start, height=0.5, color=colors[i], edgecolor='black')
-                ax.text(start + (end - start) / 2, 0, pid, ha='center', va='center', color='black', fontweight='bold')
-            ax.set_yticks([])
-            ax.set_xticks([s[1] for s in schedule] + [schedule[-1][2]])
-            ax.set_xlabel("Time")
-            ax.set_title(f"{algorithm} Gantt Chart")
-            plt.tight_layout()
-            st.pyplot(fig)
+            st.image(render_gantt(pids, starts, ends, f"{algorithm} Gantt Chart"))
             
             # Export Results
-            csv = df.to_csv(index=False) + f"\nAvg Waiting Time,{avg_waiting:.2f}\nAvg Turnaround Time,{avg_turnaround:.2f}\nAvg Response Time,{avg_response:.2f}\nCPU Utilization,{cpu_utilization:.2f}\nThroughput,{throughput:.2f}"
+            rows = ["Process,Start Time,End Time"]
+            rows += [f"{pid},{start},{end}" for pid, start, end in zip(pids.tolist(), starts.tolist(), ends.tolist())]
+            rows += [
+                "",
+                f"Avg Waiting Time,{avg_waiting:.2f}",
+                f"Avg Turnaround Time,{avg_turnaround:.2f}",
+                f"Avg Response Time,{avg_response:.2f}",
+                f"CPU Utilization,{cpu_utilization:.2f}",
+                f"Throughput,{throughput:.2f}",
+            ]
+            csv = "\n".join(rows)
             st.download_button("Download Results", csv, f"{algorithm}_results.csv", "text/csv")
         
         except Exception as e:
@@ -294,7 +324,7 @@ def main():
         try:
             results = {}
             for algo in algorithm_options:
-                schedule, wt, awt, tt, att, rt, art, cpu_util, throughput = run_simulation(process_list, algo, quantum)
+                schedule, wt, awt, tt, att, rt, art, cpu_util, throughput = run_simulation(processes, algo, quantum)
                 results[algo] = {
                     "Avg Wait": f"{awt:.2f}",
                     "Avg Turnaround": f"{att:.2f}",
@@ -0,0 +1,133 @@
+"""Compiled inner loops for the scheduling simulator.
+
+These live outside the Streamlit script because Streamlit re-executes the
+script on every rerun; as a regular module they are compiled once per process.
+The Numba kernels' machine code is also cached on disk, and the generated
+sequential runners stay in their lru_cache across reruns.
+"""
+import heapq
+from functools import lru_cache
+import numpy as np
+from typing import Tuple
+from numba import njit
+
+@njit(cache=True)
+def round_robin_kernel(arrivals: np.ndarray, bursts: np.ndarray, quantum: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Round Robin core loop.
+
+    Returns an (n_events, 3) array of (process index, start, end) plus each
+    process's first start and completion time, indexed like the inputs.
+    """
+    n = arrivals.shape[0]
+    n_events = 0
+    for i in range(n):
+        n_events += (bursts[i] + quantum - 1) // quantum
+    events = np.empty((n_events, 3), dtype=np.int64)
+    first_starts = np.full(n, -1, dtype=np.int64)
+    completion_times = np.empty(n, dtype=np.int64)
+    remaining = bursts.copy()
+    # Ring buffer of process indices; it never holds more than n entries
+    queue = np.arange(n)
+    head = 0
+    size = n
+    current_time = 0
+    for k in range(n_events):
+        idx = queue[head]
+        head = (head + 1) % n
+        size -= 1
+        start_time = max(current_time, arrivals[idx])
+        time_slice = min(quantum, remaining[idx])
+        end_time = start_time + time_slice
+        events[k, 0] = idx
+        events[k, 1] = start_time
+        events[k, 2] = end_time
+        if first_starts[idx] < 0:
+            first_starts[idx] = start_time
+        current_time = end_time
+        remaining[idx] -= time_slice
+        if remaining[idx] > 0:
+            queue[(head + size) % n] = idx
+            size += 1
+        else:
+            completion_times[idx] = end_time
+    return events, first_starts, completion_times
+
+@njit(cache=True)
+def preemptive_kernel(arrivals: np.ndarray, bursts: np.ndarray, priorities: np.ndarray, by_remaining: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Event-driven preemptive core loop over arrival-sorted arrays.
+
+    The ready queue is a min-heap of (key, arrival, index) where the key is the
+    remaining burst (SRTF) or the priority. Returns (process index, start, end)
+    rows with back-to-back slices of the same process already merged, plus each
+    process's first start and completion time.
+    """
+    n = arrivals.shape[0]
+    remaining = bursts.copy()
+    # Each slice ends at a completion or a distinct arrival time, so 2n rows suffice
+    events = np.empty((2 * n, 3), dtype=np.int64)
+    n_events = 0
+    first_starts = np.full(n, -1, dtype=np.int64)
+    completion_times = np.empty(n, dtype=np.int64)
+    ready_queue = [(np.int64(0), np.int64(0), np.int64(0)) for _ in range(0)]
+    next_idx = 0
+    current_time = arrivals[0]
+    active = -1
+    while next_idx < n or len(ready_queue) > 0 or active >= 0:
+        while next_idx < n and arrivals[next_idx] <= current_time:
+            key = bursts[next_idx] if by_remaining else priorities[next_idx]
+            # Ties on (key, arrival) fall back to the input index, never the PID string,
+            # which would run "P10" ahead of "P2"
+            heapq.heappush(ready_queue, (key, arrivals[next_idx], np.int64(next_idx)))
+            next_idx += 1
+        if active >= 0:
+            # Swap the running process out only if a ready one has a smaller key.
+            key = remaining[active] if by_remaining else priorities[active]
+            active = heapq.heappushpop(ready_queue, (key, arrivals[active], np.int64(active)))[2]
+        elif len(ready_queue) > 0:
+            active = heapq.heappop(ready_queue)[2]
+        else:
+            current_time = arrivals[next_idx]
+            continue
+        end_time = current_time + remaining[active]
+        if next_idx < n and arrivals[next_idx] < end_time:
+            end_time = arrivals[next_idx]
+        if n_events > 0 and events[n_events - 1, 0] == active and events[n_events - 1, 2] == current_time:
+            events[n_events - 1, 2] = end_time
+        else:
+            events[n_events, 0] = active
+            events[n_events, 1] = current_time
+            events[n_events, 2] = end_time
+            n_events += 1
+            if first_starts[active] < 0:
+                first_starts[active] = current_time
+        remaining[active] -= end_time - current_time
+        current_time = end_time
+        if remaining[active] == 0:
+            completion_times[active] = end_time
+            active = -1
+    return events[:n_events], first_starts, completion_times
+
+@lru_cache(maxsize=None)
+def make_sequential_runner(n: int):
+    """Generate a loop-free function that runs n processes back to back in the given order.
+
+    For n = 2 the generated source is:
+        def run(arr, burst):
+            start0 = max(0, arr[0])
+            end0 = start0 + burst[0]
+            start1 = max(end0, arr[1])
+            end1 = start1 + burst[1]
+            return [start0, start1], [end0, end1]
+    """
+    lines = ["def run(arr, burst):"]
+    prev_end = "0"
+    for i in range(n):
+        lines.append(f"    start{i} = max({prev_end}, arr[{i}])")
+        lines.append(f"    end{i} = start{i} + burst[{i}]")
+        prev_end = f"end{i}"
+    starts = ", ".join(f"start{i}" for i in range(n))
+    ends = ", ".join(f"end{i}" for i in range(n))
+    lines.append(f"    return [{starts}], [{ends}]")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["run"]